@@ -6,7 +6,7 @@ Collects accelerometer and gyroscope data from Arduino via serial port
 and saves to CSV file with timestamps.
 
 Requirements:
-    pip install pyserial
+    pip install pyserial numpy
 
 Usage:
     python data_collection.py
@@ -17,7 +17,7 @@ Configure COM_PORT below for your system:
 """
 
 import serial
-import csv
+import numpy as np
 import time
 import sys
 import os
@@ -27,6 +27,10 @@ COM_PORT = 'COM5'  # Change this to match your Arduino port
 BAUD_RATE = 115200
 CSV_FILE = 'calibrated_mpu9250_data.csv'
 TIMEOUT = 1  # Serial timeout in seconds
+BATCH_SIZE = 50  # Samples buffered in memory before each write to disk
+CSV_HEADER = b"timestamp,ax,ay,az,gx,gy,gz\n"
+CSV_ROW_FORMAT = b"%.3f,%s\n"  # Timestamp followed by the sensor values as received
+WARNING_INTERVAL = 1.0  # Minimum seconds between invalid-data warnings
 
 def find_arduino_port():
     """
@@ -40,17 +44,51 @@ def find_arduino_port():
             return port.device
     return None
 
-def validate_data_line(line):
-    """Validate that the line contains 6 numeric values."""
+class SerialLineReader:
+    """
+    Buffered line reader for a serial port.
+    
+    Reads whatever bytes are already waiting in one call and splits lines
+    from an internal buffer, instead of pyserial's byte-by-byte readline().
+    Unlike wrapping the port in io.BufferedReader, it never blocks to fill
+    a fixed-size buffer, so lines are returned as soon as they arrive and
+    their timestamps stay accurate.
+    """
+    
+    def __init__(self, ser):
+        self.ser = ser
+        self.buffer = bytearray()
+    
+    def readline(self):
+        """Return the next complete line, or b"" if the port timed out."""
+        while True:
+            end = self.buffer.find(b"\n")
+            if end >= 0:
+                line = bytes(self.buffer[:end + 1])
+                del self.buffer[:end + 1]
+                return line
+            data = self.ser.read(max(1, self.ser.in_waiting))
+            if not data:
+                # Timeout: keep any partial line for the next call
+                return b""
+            self.buffer += data
+
+def parse_data_line(line):
+    """Parse a raw serial line of 6 comma-separated values. Returns None if invalid."""
     try:
-        values = line.split(",")
-        if len(values) != 6:
-            return False
-        # Try to convert to float to validate
-        [float(val.strip()) for val in values]
-        return True
+        values = np.array(line.split(b","), dtype=np.float64)
     except ValueError:
-        return False
+        return None
+    if values.size != 6:
+        return None
+    return values
+
+def flush_buffer(file, rows):
+    """Write the buffered CSV rows to the file and clear the buffer."""
+    if rows:
+        file.write(b"".join(rows))
+        file.flush()
+        rows.clear()
 
 def main():
     print(f"MPU9250 Data Collection")
@@ -82,60 +120,72 @@ def main():
     time.sleep(3)
     
     # === Start Data Collection ===
-    start_time = time.time()
+    reader = SerialLineReader(ser)
+    # Monotonic clock; timestamps are rounded to ms only when written (CSV_ROW_FORMAT)
+    start_time = time.perf_counter()
     data_count = 0
+    invalid_count = 0
+    last_warning = float('-inf')
     
     try:
-        with open(CSV_FILE, mode='w', newline='') as file:
-            writer = csv.writer(file)
+        with open(CSV_FILE, mode='wb') as file:
+            # Rows are preformatted as bytes, reusing the sensor values exactly
+            # as received, and written in bulk once BATCH_SIZE are collected
+            rows = []
             
             # Write CSV header
-            writer.writerow(["timestamp", "ax", "ay", "az", "gx", "gy", "gz"])
+            file.write(CSV_HEADER)
             
             print("\n✓ Logging started. Data format: timestamp,ax,ay,az,gx,gy,gz")
             print("Press Ctrl+C to stop logging.\n")
             print("Time(s)  | Accel (ax,ay,az)        | Gyro (gx,gy,gz)")
             print("-" * 65)
             
-            while True:
-                try:
-                    line = ser.readline().decode('utf-8').strip()
-                    
-                    if line and validate_data_line(line):
-                        values = line.split(",")
-                        timestamp = round(time.time() - start_time, 3)
-                        
-                        # Clean up values (remove whitespace)
-                        clean_values = [val.strip() for val in values]
+            try:
+                while True:
+                    try:
+                        # Work on raw bytes to avoid decoding every line
+                        line = reader.readline().strip()
+                        values = parse_data_line(line) if line else None
                         
-                        # Write to CSV
-                        writer.writerow([timestamp] + clean_values)
-                        
-                        # Print formatted output (every 10th sample to avoid spam)
-                        data_count += 1
-                        if data_count % 10 == 0:
-                            print(f"{timestamp:6.1f}s  | "
-                                  f"{clean_values[0]:>6},{clean_values[1]:>6},{clean_values[2]:>6} | "
-                                  f"{clean_values[3]:>6},{clean_values[4]:>6},{clean_values[5]:>6}")
-                        
-                        # Flush every 50 samples to ensure data is saved
-                        if data_count % 50 == 0:
-                            file.flush()
-                    
-                    elif line and not line.startswith("ax"):  # Skip header echoes
-                        # Print invalid lines for debugging
-                        print(f"⚠ Invalid data: {line}")
+                        if values is not None:
+                            timestamp = time.perf_counter() - start_time
+                            
+                            rows.append(CSV_ROW_FORMAT % (timestamp, line.replace(b" ", b"")))
+                            
+                            # Print formatted output (every 10th sample to avoid spam)
+                            data_count += 1
+                            if data_count % 10 == 0:
+                                print(f"{timestamp:6.1f}s  | "
+                                      f"{values[0]:>6g},{values[1]:>6g},{values[2]:>6g} | "
+                                      f"{values[3]:>6g},{values[4]:>6g},{values[5]:>6g}")
+                            
+                            # Write the buffer to disk once it is full
+                            if len(rows) == BATCH_SIZE:
+                                flush_buffer(file, rows)
                         
-                except UnicodeDecodeError:
-                    print("⚠ Unicode decode error - check baud rate")
-                    continue
-                except serial.SerialException as e:
-                    print(f"✗ Serial error: {e}")
-                    break
+                        elif line and not line.startswith(b"ax"):  # Skip header echoes
+                            # Print invalid lines for debugging, rate-limited so a
+                            # noisy sensor doesn't stall the reader on terminal I/O
+                            invalid_count += 1
+                            now = time.monotonic()
+                            if now - last_warning >= WARNING_INTERVAL:
+                                print(f"⚠ Invalid data: {line.decode('utf-8', errors='replace')} "
+                                      f"(invalid lines so far: {invalid_count})")
+                                last_warning = now
+                            
+                    except serial.SerialException as e:
+                        print(f"✗ Serial error: {e}")
+                        break
+            finally:
+                # Save any samples still held in the buffer
+                flush_buffer(file, rows)
                     
     except KeyboardInterrupt:
         print(f"\n✓ Data logging stopped.")
         print(f"✓ Collected {data_count} data points")
+        if invalid_count:
+            print(f"⚠ Invalid lines skipped: {invalid_count}")
         print(f"✓ Data saved to: {CSV_FILE}")
         
     except Exception as e:
@@ -19,9 +19,38 @@ License: MIT
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from scipy.fft import rfft, rfftfreq, next_fast_len
+import os
 import warnings
 from pathlib import Path
 
+# pyarrow's multithreaded CSV reader and the Parquet data cache are used
+# when pyarrow is available
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv, parquet as pq
+except ImportError:
+    pacsv = None
+
+# Numba JIT-compiles the fused statistics kernel when available
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Parquet schema metadata key recording which CSV version a cache was built from
+CACHE_SOURCE_KEY = b'imu_fft_source_csv'
+
+# Frequencies at or below this are excluded from dominant frequency detection
+MIN_DOMINANT_FREQ = 0.1
+
+# Signals are zero-padded for the FFT only when their length has a prime
+# factor above this; smaller factors cost less than the padding changes
+FFT_MAX_PRIME_FACTOR = 100
+
+# Columns of the loaded IMU data, in CSV order
+DATA_COLUMNS = ['time', 'ax', 'ay', 'az', 'gx', 'gy', 'gz']
+
 # Configure matplotlib for professional output
 plt.style.use('seaborn-v0_8-whitegrid')
 plt.rcParams['figure.dpi'] = 100
@@ -30,6 +59,185 @@ plt.rcParams['font.size'] = 10
 plt.rcParams['axes.titlesize'] = 12
 plt.rcParams['axes.labelsize'] = 10
 plt.rcParams['legend.fontsize'] = 9
+plt.rcParams['path.simplify_threshold'] = 1.0  # Faster rendering of long traces
+
+
+def _stats_and_dom_numpy(X, amps, start):
+    """
+    Compute per-channel signal statistics and dominant frequency bins.
+    
+    Args:
+        X (ndarray): Signals, shape (n_channels, n_samples)
+        amps (ndarray): FFT amplitudes, shape (n_channels, n_bins)
+        start (int): First frequency bin considered for the peak search
+    
+    Returns:
+        tuple: (means, stds, mins, maxs, dom_idx), where dom_idx is -1 for
+        channels without any bin at or above `start`
+    """
+    means = X.mean(axis=1)
+    deviations = X - means[:, np.newaxis]
+    np.square(deviations, out=deviations)
+    stds = np.sqrt(deviations.mean(axis=1))
+    mins = X.min(axis=1)
+    maxs = X.max(axis=1)
+    
+    if start < amps.shape[1]:
+        dom_idx = start + np.argmax(amps[:, start:], axis=1)
+    else:
+        dom_idx = np.full(amps.shape[0], -1)
+    
+    return means, stds, mins, maxs, dom_idx
+
+
+def _stats_and_dom_loops(X, amps, start):
+    """
+    Loop version of _stats_and_dom_numpy for Numba.
+    
+    Statistics are accumulated in float64, and the std is taken around the
+    mean in a second pass. NaN samples propagate to the results as they do
+    with the numpy reductions.
+    """
+    n_channels, n_samples = X.shape
+    n_bins = amps.shape[1]
+    means = np.empty(n_channels)
+    stds = np.empty(n_channels)
+    mins = np.empty(n_channels)
+    maxs = np.empty(n_channels)
+    dom_idx = np.full(n_channels, -1)
+    
+    for c in numba.prange(n_channels):
+        # First pass over the signal for mean, min and max
+        total = 0.0
+        lo = np.float64(X[c, 0])
+        hi = lo
+        for j in range(n_samples):
+            v = np.float64(X[c, j])
+            total += v
+            if v < lo or np.isnan(v):
+                lo = v
+            if v > hi or np.isnan(v):
+                hi = v
+        mean = total / n_samples
+        
+        # Second pass for the variance around the mean
+        total_sq = 0.0
+        for j in range(n_samples):
+            d = np.float64(X[c, j]) - mean
+            total_sq += d * d
+        
+        means[c] = mean
+        stds[c] = np.sqrt(total_sq / n_samples)
+        mins[c] = lo
+        maxs[c] = hi
+        
+        # Constrained argmax over the spectrum (the first NaN wins, as in np.argmax)
+        if start < n_bins:
+            best = start
+            for j in range(start + 1, n_bins):
+                a = amps[c, j]
+                if a > amps[c, best] or (np.isnan(a) and not np.isnan(amps[c, best])):
+                    best = j
+            dom_idx[c] = best
+    
+    return means, stds, mins, maxs, dom_idx
+
+
+def _amplitudes_numpy(F, out):
+    """
+    Write the magnitudes of the complex spectra F into out.
+    
+    Uses np.hypot, which is correctly rounded for float32 (np.abs on
+    complex64 is not), so both backends give bit-identical amplitudes.
+    """
+    return np.hypot(F.real, F.imag, out=out)
+
+
+def _amplitudes_loops(F, out):
+    """Single-pass loop version of _amplitudes_numpy for Numba."""
+    for c in numba.prange(F.shape[0]):
+        for j in range(F.shape[1]):
+            out[c, j] = np.hypot(F[c, j].real, F[c, j].imag)
+    return out
+
+
+def _best_effort_jit(loops, fallback):
+    """
+    Compile a loop kernel with Numba without letting Numba break the analysis.
+    
+    Candidates are tried in order on the first call: the cached compile
+    (unavailable when the source has no file locator, and its on-disk cache
+    can be stale), a plain compile, and finally the numpy fallback. The
+    first candidate that succeeds is used from then on.
+    """
+    candidates = []
+    for options in ({'cache': True}, {}):
+        try:
+            candidates.append(numba.njit(parallel=True, **options)(loops))
+        except Exception:
+            pass
+    candidates.append(fallback)
+    
+    def kernel(*args):
+        while len(candidates) > 1:
+            try:
+                result = candidates[0](*args)
+            except Exception:
+                candidates.pop(0)
+                continue
+            del candidates[1:]
+            return result
+        return candidates[0](*args)
+    
+    return kernel
+
+
+if numba is not None:
+    _stats_and_dom = _best_effort_jit(_stats_and_dom_loops, _stats_and_dom_numpy)
+    _amplitudes = _best_effort_jit(_amplitudes_loops, _amplitudes_numpy)
+else:
+    _stats_and_dom = _stats_and_dom_numpy
+    _amplitudes = _amplitudes_numpy
+
+
+def _fft_length(n_samples):
+    """
+    Choose the FFT length for a signal of n_samples points.
+    
+    Returns n_samples unless it has a prime factor above FFT_MAX_PRIME_FACTOR,
+    which the FFT handles several times slower; such signals are zero-padded
+    to the next FFT-friendly length.
+    """
+    remainder = n_samples
+    for factor in range(2, FFT_MAX_PRIME_FACTOR + 1):
+        while remainder % factor == 0:
+            remainder //= factor
+    if remainder == 1:
+        return n_samples
+    return next_fast_len(n_samples, real=True)
+
+
+def _maxpool(x, y, target=2000):
+    """
+    Decimate a spectrum for plotting by keeping the peak of each block.
+    
+    Args:
+        x (ndarray): Frequencies
+        y (ndarray): Amplitudes
+        target (int): Approximate number of points to keep
+    
+    Returns:
+        tuple: (x, y) with roughly `target` points; spectra that are
+        already short enough are returned unchanged
+    """
+    k = max(1, len(y) // target)
+    if k == 1:
+        return x, y
+    n_full = k * (len(y) // k)
+    idx = np.arange(0, n_full, k) + y[:n_full].reshape(-1, k).argmax(axis=1)
+    if n_full < len(y):
+        idx = np.append(idx, n_full + np.argmax(y[n_full:]))
+    return x[idx], y[idx]
 
 class IMUAnalyzer:
     """
@@ -45,7 +253,12 @@ class IMUAnalyzer:
         """
         self.csv_path = csv_file_path
         self.df = None
+        self.time = None
+        self.signals = None
         self.fft_results = {}
+        self.fft_frequencies = None
+        self.fft_amplitudes = None
+        self.dominant_bins = None
         self.sensor_config = {
             'ax': {'label': 'Accel X', 'unit': 'g', 'color': '#e74c3c', 'type': 'accel'},
             'ay': {'label': 'Accel Y', 'unit': 'g', 'color': '#3498db', 'type': 'accel'},
@@ -56,23 +269,117 @@ class IMUAnalyzer:
         }
         
     def load_data(self):
-        """Load IMU data from CSV file."""
+        """
+        Load IMU data from CSV file.
+        
+        When pyarrow is installed, the parsed data is cached in a Parquet
+        file next to the CSV (<name>.csv.parquet). The cache records the
+        size and modification time of the CSV it was built from and is only
+        reused while both match exactly. The cache is only an optimization:
+        if it cannot be read or written, the CSV is used as usual.
+        """
         try:
-            self.df = pd.read_csv(self.csv_path)
-            self.df.columns = ['time', 'ax', 'ay', 'az', 'gx', 'gy', 'gz']
+            csv_path = Path(self.csv_path)
+            cache_path = csv_path.with_name(csv_path.name + '.parquet')
+            # Taken before parsing, so a CSV modified meanwhile invalidates the cache
+            csv_stat = csv_path.stat()
+            source = f"{csv_stat.st_size}:{csv_stat.st_mtime_ns}".encode()
+            
+            if not (pacsv is not None and self._read_cache(cache_path, source)):
+                self._read_csv()
+                if pacsv is not None:
+                    self._write_cache(cache_path, source)
+            
+            self._extract_arrays()
             print(f"Successfully loaded data: {self.df.shape[0]} samples")
             return True
         except Exception as e:
             print(f"Error loading data: {e}")
             return False
     
+    def _read_cache(self, cache_path, source):
+        """
+        Load self.df from the Parquet cache if it is current and valid.
+        
+        Args:
+            cache_path (Path): Path of the Parquet cache
+            source (bytes): "<size>:<mtime_ns>" of the CSV file
+        
+        Returns:
+            bool: True if the cache was used, False if the CSV must be read
+        """
+        try:
+            if not cache_path.exists():
+                return False
+            metadata = pq.read_schema(cache_path).metadata or {}
+            if metadata.get(CACHE_SOURCE_KEY) != source:
+                return False
+            df = pq.read_table(cache_path).to_pandas()
+        except Exception as e:
+            print(f"Ignoring unreadable data cache {cache_path.name}: {e}")
+            return False
+        
+        if list(df.columns) != DATA_COLUMNS:
+            print(f"Ignoring data cache {cache_path.name}: unexpected columns")
+            return False
+        
+        self.df = df
+        print(f"Using cached data: {cache_path.name}")
+        return True
+    
+    def _write_cache(self, cache_path, source):
+        """Write self.df to the Parquet cache, replacing it atomically."""
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            table = pa.Table.from_pandas(self.df, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[CACHE_SOURCE_KEY] = source
+            pq.write_table(table.replace_schema_metadata(metadata), tmp_path,
+                           compression='snappy')
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Could not write data cache: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    def _read_csv(self):
+        """Parse the CSV file into self.df."""
+        if pacsv is not None:
+            table = pacsv.read_csv(
+                self.csv_path,
+                read_options=pacsv.ReadOptions(column_names=DATA_COLUMNS, skip_rows=1)
+            )
+            self.df = table.to_pandas()
+        else:
+            self.df = pd.read_csv(self.csv_path)
+            self.df.columns = DATA_COLUMNS
+    
+    def _extract_arrays(self):
+        """
+        Materialize the loaded data as plain ndarrays for the analysis.
+        
+        self.time holds the float64 timestamps and self.signals is a
+        C-contiguous float32 matrix of shape (n_channels, n_samples) with
+        one row per sensor_config channel. Sensor data is far below float32
+        precision; timestamps stay float64 to keep the sampling interval exact.
+        """
+        channels = list(self.sensor_config)
+        self.time = self.df['time'].to_numpy(dtype=np.float64)
+        # Rows are filled in place to avoid an intermediate transposed copy
+        self.signals = np.empty((len(channels), len(self.df)), dtype=np.float32)
+        for i, channel in enumerate(channels):
+            self.signals[i] = self.df[channel].to_numpy()
+    
     def calculate_sampling_params(self):
         """Calculate sampling parameters from the data."""
-        t = self.df['time'].values
-        dt = np.mean(np.diff(t))
+        t = self.time
+        n_samples = len(t)
+        duration = t[-1] - t[0]
+        # Mean sample interval; the mean of np.diff(t) telescopes to this
+        dt = duration / (n_samples - 1)
         fs = 1 / dt
-        n_samples = len(self.df)
-        duration = self.df['time'].iloc[-1] - self.df['time'].iloc[0]
         
         self.sampling_params = {
             'dt': dt,
@@ -88,33 +395,61 @@ class IMUAnalyzer:
         """Perform FFT analysis on all sensor channels."""
         print("Performing FFT analysis...")
         
-        for channel, config in self.sensor_config.items():
-            signal = self.df[channel].values
-            
-            # Apply FFT
-            fft_vals = np.fft.fft(signal)
-            fft_freqs = np.fft.fftfreq(self.sampling_params['n_samples'], 
-                                     d=self.sampling_params['dt'])
-            
-            # Keep only positive frequencies
-            pos_mask = fft_freqs >= 0
-            fft_vals_pos = fft_vals[pos_mask]
-            fft_freqs_pos = fft_freqs[pos_mask]
-            
-            # Calculate signal statistics
+        channels = list(self.sensor_config)
+        
+        # All channels are transformed in a single batched FFT call over
+        # the (n_channels, n_samples) float32 matrix, so the FFT runs in
+        # complex64
+        X = self.signals
+        
+        # Lengths with a large prime factor are zero-padded to a fast FFT
+        # length. Padding samples the same spectrum on a slightly finer grid
+        # without improving the resolution (still fs/N), and it shifts
+        # amplitudes (a sine exactly on a bin loses up to about a third)
+        n_samples = self.sampling_params['n_samples']
+        n_fft = _fft_length(n_samples)
+        self.sampling_params['n_fft'] = n_fft
+        
+        # Apply real-input FFT (returns only the non-negative frequencies),
+        # spreading the channels across all available CPU cores
+        if n_fft == n_samples:
+            fft_vals = rfft(X, axis=1, workers=-1)
+        else:
+            # Remove the channel means before padding: an offset followed by
+            # zeros is a step whose leakage would dominate the low bins. The
+            # DC bin is restored afterwards
+            offsets = X.mean(axis=1, dtype=np.float64)
+            centered = X - offsets.astype(X.dtype)[:, np.newaxis]
+            fft_vals = rfft(centered, n=n_fft, axis=1, workers=-1)
+            fft_vals[:, 0] += offsets * n_samples
+        fft_freqs = rfftfreq(n_fft, d=self.sampling_params['dt'])
+        amplitudes = _amplitudes(fft_vals, np.empty(fft_vals.shape, dtype=fft_vals.real.dtype))
+        phases = np.angle(fft_vals)
+        
+        # Keep the batched spectra for vectorized post-processing
+        self.fft_frequencies = fft_freqs
+        self.fft_amplitudes = amplitudes
+        
+        # Calculate signal statistics and locate each channel's spectral
+        # peak (excluding DC and very low frequencies) in one fused pass
+        start = np.searchsorted(fft_freqs, MIN_DOMINANT_FREQ, side='right')
+        means, stds, mins, maxs, self.dominant_bins = _stats_and_dom(X, amplitudes, start)
+        peak_to_peak = maxs - mins
+        
+        # Store results
+        for i, channel in enumerate(channels):
             signal_stats = {
-                'mean': np.mean(signal),
-                'std': np.std(signal),
-                'min': np.min(signal),
-                'max': np.max(signal),
-                'peak_to_peak': np.max(signal) - np.min(signal)
+                'mean': means[i],
+                'std': stds[i],
+                'min': mins[i],
+                'max': maxs[i],
+                'peak_to_peak': peak_to_peak[i]
             }
             
-            # Store results
             self.fft_results[channel] = {
-                'frequencies': fft_freqs_pos,
-                'amplitudes': np.abs(fft_vals_pos),
-                'phases': np.angle(fft_vals_pos),
+                'frequencies': fft_freqs,
+                'amplitudes': amplitudes[i],
+                'phases': phases[i],
                 'signal_stats': signal_stats
             }
         
@@ -122,25 +457,18 @@ class IMUAnalyzer:
     
     def find_dominant_frequencies(self):
         """Find dominant frequencies for each channel."""
-        dominant_freqs = {}
+        freqs = self.fft_frequencies
+        amps = self.fft_amplitudes
         
-        for channel, fft_data in self.fft_results.items():
-            freqs = fft_data['frequencies']
-            amps = fft_data['amplitudes']
-            
-            # Exclude DC component and very low frequencies
-            non_dc_mask = freqs > 0.1
-            
-            if np.any(non_dc_mask):
-                peak_indices = np.where(non_dc_mask)[0]
-                if len(peak_indices) > 0:
-                    max_amp_idx = peak_indices[np.argmax(amps[peak_indices])]
-                    dominant_freqs[channel] = {
-                        'frequency': freqs[max_amp_idx],
-                        'amplitude': amps[max_amp_idx]
-                    }
-                else:
-                    dominant_freqs[channel] = {'frequency': 0, 'amplitude': 0}
+        # Peak bins were located during the FFT analysis
+        dominant_freqs = {}
+        for i, channel in enumerate(self.fft_results):
+            idx = self.dominant_bins[i]
+            if idx >= 0:
+                dominant_freqs[channel] = {
+                    'frequency': freqs[idx],
+                    'amplitude': amps[i, idx]
+                }
             else:
                 dominant_freqs[channel] = {'frequency': 0, 'amplitude': 0}
         
@@ -148,79 +476,90 @@ class IMUAnalyzer:
     
     def create_comprehensive_plots(self, save_path=None):
         """Create comprehensive visualization plots."""
-        fig = plt.figure(figsize=(16, 28))  # Increased height for 6 individual plots
+        # Increased height for 6 individual plots
+        fig, axes = plt.subplots(6, 2, figsize=(16, 28))
         
         # Time domain plots
-        plt.subplot(6, 2, 1)
-        for channel, config in self.sensor_config.items():
+        ax = axes[0, 0]
+        for i, config in enumerate(self.sensor_config.values()):
             if config['type'] == 'accel':
-                plt.plot(self.df['time'], self.df[channel], 
+                ax.plot(self.time, self.signals[i],
                         label=config['label'], color=config['color'], linewidth=1.5)
-        plt.title('Accelerometer Data - Time Domain', fontweight='bold')
-        plt.xlabel('Time (s)')
-        plt.ylabel('Acceleration (g)')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
+        ax.set_title('Accelerometer Data - Time Domain', fontweight='bold')
+        ax.set_xlabel('Time (s)')
+        ax.set_ylabel('Acceleration (g)')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
         
-        plt.subplot(6, 2, 2)
-        for channel, config in self.sensor_config.items():
+        ax = axes[0, 1]
+        for i, config in enumerate(self.sensor_config.values()):
             if config['type'] == 'gyro':
-                plt.plot(self.df['time'], self.df[channel], 
+                ax.plot(self.time, self.signals[i],
                         label=config['label'], color=config['color'], linewidth=1.5)
-        plt.title('Gyroscope Data - Time Domain', fontweight='bold')
-        plt.xlabel('Time (s)')
-        plt.ylabel('Angular Velocity (deg/s)')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
+        ax.set_title('Gyroscope Data - Time Domain', fontweight='bold')
+        ax.set_xlabel('Time (s)')
+        ax.set_ylabel('Angular Velocity (deg/s)')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
         
         # Frequency domain plots
-        plt.subplot(6, 2, 3)
+        ax = axes[1, 0]
         for channel, config in self.sensor_config.items():
             if config['type'] == 'accel':
                 fft_data = self.fft_results[channel]
-                plt.plot(fft_data['frequencies'], fft_data['amplitudes'],
-                        label=f"{config['label']} FFT", color=config['color'], linewidth=1.5)
-        plt.title('Accelerometer FFT - Frequency Domain', fontweight='bold')
-        plt.xlabel('Frequency (Hz)')
-        plt.ylabel('Amplitude')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.xlim(-0.2, self.sampling_params['nyquist_freq'])
-        
-        plt.subplot(6, 2, 4)
+                ax.plot(fft_data['frequencies'], fft_data['amplitudes'],
+                        label=f"{config['label']} FFT", color=config['color'],
+                        linewidth=1.5, rasterized=True)
+        ax.set_title('Accelerometer FFT - Frequency Domain', fontweight='bold')
+        ax.set_xlabel('Frequency (Hz)')
+        ax.set_ylabel('Amplitude')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        ax.set_xlim(-0.2, self.sampling_params['nyquist_freq'])
+        
+        ax = axes[1, 1]
         for channel, config in self.sensor_config.items():
             if config['type'] == 'gyro':
                 fft_data = self.fft_results[channel]
-                plt.plot(fft_data['frequencies'], fft_data['amplitudes'],
-                        label=f"{config['label']} FFT", color=config['color'], linewidth=1.5)
-        plt.title('Gyroscope FFT - Frequency Domain', fontweight='bold')
-        plt.xlabel('Frequency (Hz)')
-        plt.ylabel('Amplitude')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.xlim(-0.2, self.sampling_params['nyquist_freq'])
-        
-        # Individual channel FFT plots (all 6 channels)
-        subplot_positions = [(6, 2, 5), (6, 2, 6), (6, 2, 7), (6, 2, 8), (6, 2, 9), (6, 2, 10)]
+                ax.plot(fft_data['frequencies'], fft_data['amplitudes'],
+                        label=f"{config['label']} FFT", color=config['color'],
+                        linewidth=1.5, rasterized=True)
+        ax.set_title('Gyroscope FFT - Frequency Domain', fontweight='bold')
+        ax.set_xlabel('Frequency (Hz)')
+        ax.set_ylabel('Amplitude')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        ax.set_xlim(-0.2, self.sampling_params['nyquist_freq'])
+        
+        # Individual channel FFT plots (all 6 channels), filling rows 3-5
         channels_to_plot = ['ax', 'ay', 'az', 'gx', 'gy', 'gz']
+        detail_axes = axes[2:5].flat
         
-        for i, channel in enumerate(channels_to_plot):
-            plt.subplot(*subplot_positions[i])
+        for ax, channel in zip(detail_axes, channels_to_plot):
             config = self.sensor_config[channel]
             fft_data = self.fft_results[channel]
             
-            plt.plot(fft_data['frequencies'], fft_data['amplitudes'],
-                    color=config['color'], linewidth=2)
-            plt.title(f'{config["label"]} - Detailed FFT', fontweight='bold')
-            plt.xlabel('Frequency (Hz)')
-            plt.ylabel('Amplitude')
-            plt.grid(True, alpha=0.3)
-            plt.xlim(-0.2, min(50, self.sampling_params['nyquist_freq']))
+            # Plot the visible range at roughly screen resolution; analysis
+            # uses the full spectrum
+            freqs = fft_data['frequencies']
+            xmax = min(50, self.sampling_params['nyquist_freq'])
+            hi = np.searchsorted(freqs, xmax, side='right')
+            freqs, amps = _maxpool(freqs[:hi], fft_data['amplitudes'][:hi])
+            ax.plot(freqs, amps, color=config['color'], linewidth=2, rasterized=True)
+            ax.set_title(f'{config["label"]} - Detailed FFT', fontweight='bold')
+            ax.set_xlabel('Frequency (Hz)')
+            ax.set_ylabel('Amplitude')
+            ax.grid(True, alpha=0.3)
+            ax.set_xlim(-0.2, xmax)
+        
+        # The last grid row is left empty
+        for ax in axes[5]:
+            fig.delaxes(ax)
         
-        plt.tight_layout(pad=3.0)
+        fig.tight_layout(pad=3.0)
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
             print(f"Plots saved to: {save_path}")
         
         plt.show()
@@ -277,7 +616,11 @@ class IMUAnalyzer:
         print(summary_df.to_string(index=False))
         
         print(f"\nANALYSIS NOTES:")
-        print(f"- Frequency resolution: {self.fft_results['ax']['frequencies'][1]:.3f} Hz")
+        print(f"- Frequency resolution: "
+              f"{self.sampling_params['fs'] / self.sampling_params['n_samples']:.3f} Hz")
+        if self.sampling_params['n_fft'] != self.sampling_params['n_samples']:
+            print(f"- FFT bin spacing (zero-padded to {self.sampling_params['n_fft']} points): "
+                  f"{self.fft_frequencies[1]:.3f} Hz")
         print(f"- Analysis based on calibrated IMU sensor data")
         print(f"- Low dominant frequencies may indicate slow movements or drift")
         print(f"- Consider high-pass filtering for motion analysis applications")